@@ -1,67 +1,403 @@
 #!/usr/bin/env python3
-import curses
-import json
+import asyncio
+import os
 import re
-from dataclasses import dataclass
+import shlex
+import shutil
+import signal
+import sys
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
-import subprocess
+from typing import Iterable, Optional, Sequence, Union
+
+# orjson serializes in C without recursing through Python objects; the
+# stdlib json fallback keeps us dependency-free when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 APP_NAME = "iwctl-helper"
 CONFIG_DIR = Path.home() / ".config" / APP_NAME
 CONFIG_PATH = CONFIG_DIR / "config.json"
 
+# mkdir(parents=True, exist_ok=True) costs a stat per path component;
+# only pay it on the first save of the process.
+_config_dir_ready = False
+
 # ---- ANSI stripping (for iwctl colored output) ----
-ANSI_ESCAPE_RE = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]')
+# A CSI sequence is ESC [ followed by parameter bytes (0-?), intermediate
+# bytes (space-/) and one final byte (@-~).  Most iwctl output has no escape
+# codes at all, so check for ESC first and only scan when one is present;
+# this is cheaper than running a regex over every redraw.
 
 def strip_ansi(s: str) -> str:
-    return ANSI_ESCAPE_RE.sub('', s)
+    if '\x1b' not in s:
+        return s
+    parts = []
+    pos = 0
+    n = len(s)
+    while True:
+        idx = s.find('\x1b[', pos)
+        if idx < 0:
+            parts.append(s[pos:])
+            break
+        parts.append(s[pos:idx])
+        i = idx + 2
+        while i < n and '0' <= s[i] <= '?':  # parameter bytes
+            i += 1
+        while i < n and ' ' <= s[i] <= '/':  # intermediate bytes
+            i += 1
+        pos = i + 1 if i < n else n  # skip the final byte
+    return ''.join(parts)
+
+
+def strip_ansi_bytes(s: bytes) -> bytes:
+    """strip_ansi for undecoded iwctl output (indexing yields ints)."""
+    if b'\x1b' not in s:
+        return s
+    parts = []
+    pos = 0
+    n = len(s)
+    while True:
+        idx = s.find(b'\x1b[', pos)
+        if idx < 0:
+            parts.append(s[pos:])
+            break
+        parts.append(s[pos:idx])
+        i = idx + 2
+        while i < n and 0x30 <= s[i] <= 0x3f:  # parameter bytes
+            i += 1
+        while i < n and 0x20 <= s[i] <= 0x2f:  # intermediate bytes
+            i += 1
+        pos = i + 1 if i < n else n  # skip the final byte
+    return b''.join(parts)
 
 
-@dataclass
 class AppState:
-    station: Optional[str] = None  # used as <wlan>
-    adapter: Optional[str] = None  # used as <phy>
+    """
+    Persisted defaults (station/adapter) plus runtime-only session state.
 
-    def save(self):
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with CONFIG_PATH.open("w", encoding="utf-8") as f:
-            json.dump({"station": self.station, "adapter": self.adapter}, f, indent=2)
+    The config file is not read at construction: the first access to
+    station or adapter triggers the load, so code paths that exit before
+    touching the defaults never pay the read-and-parse.
+    """
 
-    @classmethod
-    def load(cls) -> "AppState":
+    def __init__(self, station: Optional[str] = None, adapter: Optional[str] = None):
+        self._station = station  # used as <wlan>
+        self._adapter = adapter  # used as <phy>
+        self._loaded = True
+        # startup scan prefetch (see tui_main); runtime-only, never persisted
+        self.scan_task: Optional["asyncio.Task"] = None
+        # last non-default wlan the user typed into ask_wlan; runtime-only
+        self.wlan_override: Optional[str] = None
+        self.wlan_override_ts: float = 0.0
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
         if CONFIG_PATH.exists():
             try:
-                with CONFIG_PATH.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-                return cls(
-                    station=data.get("station"),
-                    adapter=data.get("adapter"),
-                )
+                raw = CONFIG_PATH.read_bytes()
+                if orjson is not None:
+                    data = orjson.loads(raw)
+                else:
+                    import json
+                    data = json.loads(raw)
+                self._station = data.get("station")
+                self._adapter = data.get("adapter")
             except Exception:
-                return cls()
-        return cls()
+                pass
+
+    @property
+    def station(self) -> Optional[str]:
+        self._ensure_loaded()
+        return self._station
+
+    @station.setter
+    def station(self, value: Optional[str]) -> None:
+        self._ensure_loaded()
+        self._station = value
+
+    @property
+    def adapter(self) -> Optional[str]:
+        self._ensure_loaded()
+        return self._adapter
+
+    @adapter.setter
+    def adapter(self, value: Optional[str]) -> None:
+        self._ensure_loaded()
+        self._adapter = value
+
+    def save(self) -> None:
+        global _config_dir_ready
+        if not _config_dir_ready:
+            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+            _config_dir_ready = True
+        data = {"station": self.station, "adapter": self.adapter}
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            import json
+            payload = json.dumps(data, indent=2).encode("utf-8")
+        # write-then-rename so a crash mid-write can't truncate the config
+        tmp = CONFIG_PATH.with_suffix(".json.tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, CONFIG_PATH)
+
+    @classmethod
+    def load(cls) -> "AppState":
+        """Defaults-backed state; no I/O until a default is first used."""
+        state = cls()
+        state._loaded = False
+        return state
 
 
 # ---------- shell helpers ----------
 
-def run_iwctl(args):
+# Resolve iwctl once at import; spawning with an absolute path saves the
+# kernel a $PATH walk (a stat per PATH entry) on every menu action.
+_IWCTL_BIN = shutil.which("iwctl")
+
+_IWCTL_MISSING = "iwctl not found in PATH. Please install iwd / iwctl."
+
+# Output of read-only iwctl verbs is cached for a short while, so e.g.
+# "Scan" followed by "Get networks" followed by re-entering the menu does
+# not spawn a fresh iwctl (fork + exec + D-Bus attach) each time.  Any
+# state-mutating verb drops the whole cache; Ctrl-R in a menu does too.
+_READONLY_VERBS = frozenset({
+    "list",
+    "show",
+    "get-networks",
+    "get-bsses",
+    "get-hidden-access-points",
+})
+_MUTATING_VERBS = frozenset({
+    "scan",
+    "connect",
+    "connect-hidden",
+    "disconnect",
+    "set-property",
+    "start",
+    "start_open",
+    "start-profile",
+    "start-enrollee",
+    "start-configurator",
+    "start-user-pin",
+    "start-pin",
+    "stop",
+    "forget",
+    "push-button",
+    "cancel",
+    "enroll",
+    "configure",
+    "roam",
+    "autoconnect",
+})
+_CACHE_TTL = 30.0  # seconds
+_cache: dict[tuple[str, ...], tuple[float, bytes, bytes, int]] = {}
+
+
+def _invalidate_cache() -> None:
+    _cache.clear()
+
+
+# A single long-lived interactive iwctl session amortizes the per-command
+# fork/exec and D-Bus attach (the dominant per-action latency).  Commands
+# are written to its stdin and output is read back until iwctl echoes its
+# prompt.  If the session cannot be started, dies, or stops answering,
+# run_iwctl silently falls back to one-shot subprocesses.
+_SESSION_PROMPT = b"[iwd]#"
+_SESSION_START_TIMEOUT = 5.0
+_SESSION_CMD_TIMEOUT = 30.0
+_SESSION_RETRY_COOLDOWN = 60.0
+_session_proc: Optional[asyncio.subprocess.Process] = None
+_session_lock = None  # created lazily: needs a running event loop
+# After a session failure, don't retry the interactive mode before this
+# monotonic time; one-shot spawns cover the cooldown window.
+_session_retry_at = 0.0
+
+
+async def _session_read_to_prompt(proc) -> bytes:
+    """Read session output up to (but not including) the next prompt."""
+    buf = bytearray()
+    while True:
+        chunk = await proc.stdout.read(1024)
+        if not chunk:
+            raise ConnectionError("iwctl session closed")
+        buf += chunk
+        idx = buf.find(_SESSION_PROMPT)
+        if idx >= 0:
+            return bytes(buf[:idx])
+
+
+async def _session_start() -> asyncio.subprocess.Process:
+    global _session_proc
+    # close_fds=False (we open no inheritable fds) keeps subprocess on
+    # its posix_spawn fast path: no page-table copy, no fd-table walk.
+    # The absolute _IWCTL_BIN path avoids the exec $PATH search as well.
+    proc = await asyncio.create_subprocess_exec(
+        _IWCTL_BIN,
+        "--dont-ask",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        close_fds=False,
+    )
+    # swallow the greeting up to the first prompt
+    try:
+        await asyncio.wait_for(_session_read_to_prompt(proc), _SESSION_START_TIMEOUT)
+    except BaseException:  # TimeoutError, CancelledError, broken pipe, ...
+        # _session_proc isn't assigned yet, so _session_close can't reach
+        # this child; kill it here or it outlives us as an orphan holding
+        # its D-Bus connection and pipes (once per retry cooldown)
+        try:
+            proc.kill()
+            await asyncio.wait_for(proc.wait(), 2.0)
+        except (ProcessLookupError, asyncio.TimeoutError):
+            pass
+        raise
+    _session_proc = proc
+    return proc
+
+
+async def _session_close() -> None:
+    global _session_proc, _session_lock
+    proc = _session_proc
+    _session_proc = None
+    # the lock is tied to the loop it was first used on; recreate next time
+    _session_lock = None
+    if proc is not None and proc.returncode is None:
+        try:
+            proc.kill()
+            # wait() resolves only once the stdio pipes close; if some
+            # descendant inherited them, don't let teardown hang the UI
+            await asyncio.wait_for(proc.wait(), 2.0)
+        except (ProcessLookupError, asyncio.TimeoutError):
+            pass
+
+
+async def _session_command(args: Sequence[str]) -> bytes:
     """
-    Run iwctl and return (stdout, stderr, returncode).
+    Send one command over the persistent session and return its raw output.
+    Raises on any framing/process problem; the caller falls back.
     """
+    global _session_lock
+    if _session_lock is None:
+        _session_lock = asyncio.Lock()
+    async with _session_lock:
+        proc = _session_proc
+        if proc is None or proc.returncode is not None:
+            proc = await _session_start()
+        line = (shlex.join(args) + "\n").encode()
+        proc.stdin.write(line)
+        await proc.stdin.drain()
+        raw = await asyncio.wait_for(
+            _session_read_to_prompt(proc), _SESSION_CMD_TIMEOUT
+        )
+    # drop the echoed command line, if iwctl echoed it back; ANSI codes
+    # are stripped later, and only for the lines that get displayed
+    first, _, rest = raw.partition(b"\n")
+    if first.strip() == line.strip():
+        raw = rest
+    return raw.strip(b"\r\n")
+
+
+async def _run_iwctl_once(args: Sequence[str]) -> tuple[bytes, bytes, Optional[int]]:
+    """One-shot spawn; used when the persistent session is unavailable."""
     try:
-        proc = subprocess.run(
-            ["iwctl"] + args,
-            capture_output=True,
-            text=True,
-            check=False,
+        proc = await asyncio.create_subprocess_exec(
+            _IWCTL_BIN,
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False,  # keep the posix_spawn fast path (see above)
         )
-        return proc.stdout, proc.stderr, proc.returncode
     except FileNotFoundError:
-        return "", "iwctl not found in PATH. Please install iwd / iwctl.", 127
+        # the binary disappeared after the import-time lookup
+        return b"", _IWCTL_MISSING.encode(), 127
+    try:
+        out, err = await proc.communicate()
+    except asyncio.CancelledError:
+        proc.kill()  # don't orphan the child when the action is cancelled
+        raise
+    return out, err, proc.returncode
 
 
-def first_run_setup(state: AppState) -> AppState:
+async def run_iwctl(args: Sequence[str]) -> tuple[bytes, bytes, Optional[int]]:
+    """
+    Run iwctl and return (stdout, stderr, returncode), stdout/stderr
+    as undecoded bytes: for big listings only the lines that fit on
+    screen are ever decoded (see show_output_screen).
+
+    Commands go through the persistent interactive session when possible
+    (interactive mode reports no exit code, so rc is 0 and errors appear
+    in stdout); otherwise a one-shot asyncio subprocess is used.  Either
+    way the event loop (and the curses UI) stays responsive.
+    """
+    global _session_retry_at
+    if _IWCTL_BIN is None:
+        return b"", _IWCTL_MISSING.encode(), 127
+
+    key = tuple(args)
+    cacheable = _READONLY_VERBS.intersection(key) and not _MUTATING_VERBS.intersection(key)
+    if cacheable:
+        hit = _cache.get(key)
+        if hit is not None:
+            ts, out, err, rc = hit
+            if time.monotonic() - ts < _CACHE_TTL:
+                return out, err, rc
+            del _cache[key]
+
+    result = None
+    if time.monotonic() >= _session_retry_at:
+        try:
+            result = (await _session_command(args), b"", 0)
+        except asyncio.CancelledError:
+            # cancelled mid-command: the reply is still in the pipe and
+            # would corrupt the next command's framing, so drop the child
+            await _session_close()
+            raise
+        except Exception:
+            # dead/hung/unframeable session: drop it, use one-shot for a
+            # while, then give interactive mode another chance
+            await _session_close()
+            _session_retry_at = time.monotonic() + _SESSION_RETRY_COOLDOWN
+    if result is None:
+        result = await _run_iwctl_once(args)
+
+    if cacheable:
+        _cache[key] = (time.monotonic(),) + result
+    elif _MUTATING_VERBS.intersection(key):
+        # iwd state changed; cached listings may now be stale
+        _invalidate_cache()
+    return result
+
+
+def _fmt_cmd(args: Iterable[str]) -> str:
+    """Shell-quoted display form of an iwctl invocation."""
+    return shlex.join(("iwctl", *args))
+
+
+# Every possible 8-bit exit code, formatted and interned once at import;
+# _fmt_err never allocates on the failure path.
+_EXIT_CODE_STRS: dict[int, str] = {
+    rc: sys.intern(f"Exit code: {rc}") for rc in range(256)
+}
+
+
+def _fmt_err(err: Union[bytes, str], rc: Optional[int]) -> Union[bytes, str]:
+    """Error text for show_output_screen: stderr if any, else the exit code."""
+    if err:
+        return err
+    if rc:
+        return _EXIT_CODE_STRS.get(rc) or f"Exit code: {rc}"
+    return ""
+
+
+async def first_run_setup(state: AppState) -> AppState:
     """
     Show `iwctl device list` and ask for default station/adapter on first run.
     This is done outside curses.
@@ -73,11 +409,11 @@ def first_run_setup(state: AppState) -> AppState:
     print("------------------------------------")
     print("Running: iwctl device list\n")
 
-    out, err, rc = run_iwctl(["device", "list"])
+    out, err, rc = await run_iwctl(["device", "list"])
     if out:
-        print(out)
+        print(strip_ansi_bytes(out).decode("utf-8", errors="ignore"))
     if err:
-        print(err)
+        print(strip_ansi_bytes(err).decode("utf-8", errors="ignore"))
     if rc != 0:
         print(f"\nWARNING: iwctl returned exit code {rc}\n")
 
@@ -93,987 +429,1075 @@ def first_run_setup(state: AppState) -> AppState:
     state.save()
     print("\nDefaults saved. Launching TUI.")
     input("Press Enter to continue...")
+    # this event loop ends here; the TUI loop starts its own session
+    await _session_close()
     return state
 
 
 # ---------- curses helpers ----------
 
-def draw_centered(stdscr, y, text, attr=0):
+# Keys are pumped from stdin into this queue by loop.add_reader (see
+# tui_main), so coroutines can await a key press without blocking the loop.
+_key_queue: Optional[asyncio.Queue] = None
+
+
+def _pump_keys(stdscr, queue: asyncio.Queue) -> None:
+    """Drain every key curses has buffered into the asyncio queue."""
+    while True:
+        try:
+            ch = stdscr.get_wch()  # str for text keys, int for function keys
+        except curses.error:  # nothing more buffered
+            return
+        queue.put_nowait(ch)
+
+
+def _on_resize(stdscr, queue: asyncio.Queue) -> None:
+    """
+    SIGWINCH handler: registering with asyncio replaces the ncurses
+    signal handler, so resize the curses screen from the new terminal
+    size ourselves and queue the KEY_RESIZE ncurses would have
+    delivered.  Without this a resize sat unprocessed until the next
+    real keypress, since SIGWINCH never makes stdin readable.
+    """
+    try:
+        size = os.get_terminal_size(sys.stdin.fileno())
+        curses.resizeterm(size.lines, size.columns)
+    except (OSError, ValueError, curses.error):
+        pass
+    queue.put_nowait(curses.KEY_RESIZE)
+
+
+async def _getkey(stdscr) -> Union[str, int]:
+    """Await the next key: str for printable input, int for special keys."""
+    # Flush all pending noutrefresh()es in one terminal write.  Paint code
+    # only updates the virtual screen; the physical update happens here,
+    # once per key wait, however many screens were drawn in between.
+    curses.doupdate()
+    return await _key_queue.get()
+
+
+async def _getch(stdscr) -> int:
+    """Await the next key press as a curses key code."""
+    key = await _getkey(stdscr)
+    return ord(key) if isinstance(key, str) else key
+
+
+# Attribute combinations used in the paint loops, computed once after
+# curses is initialized instead of via LOAD_ATTR + BINARY_OR per frame.
+_ATTR_BOLD = 0
+_ATTR_TITLE = 0
+_ATTR_CMD = 0
+_ATTR_HL = 0
+_ATTR_STATUS = 0
+
+
+def _init_attrs() -> None:
+    global _ATTR_BOLD, _ATTR_TITLE, _ATTR_CMD, _ATTR_HL, _ATTR_STATUS
+    _ATTR_BOLD = curses.A_BOLD
+    _ATTR_TITLE = curses.A_BOLD | curses.A_UNDERLINE
+    _ATTR_CMD = curses.A_DIM
+    _ATTR_HL = curses.A_STANDOUT
+    _ATTR_STATUS = curses.A_REVERSE
+
+
+def draw_centered(stdscr, y: int, text: str, attr: int = 0) -> None:
     h, w = stdscr.getmaxyx()
     x = max(0, (w - len(text)) // 2)
     stdscr.addstr(y, x, text[: max(w - x - 1, 0)], attr)
 
 
-def input_curses(stdscr, prompt: str, initial: str = "") -> str:
+async def input_curses(stdscr, prompt: str, initial: str = "") -> str:
     """
     Simple line input in curses; supports spaces.
+
+    Reads key-by-key from the asyncio key queue and echoes by hand, so
+    there is no blocking getstr and no echo()/noecho() mode toggling,
+    and the event loop keeps running while the user types.
     """
-    curses.echo()
-    stdscr.clear()
+    buf = list(initial)
+    # erase(), not clear(): clear() sets clearok and forces the next
+    # doupdate to rewrite the whole terminal; erase() lets curses diff
+    stdscr.erase()
     stdscr.addstr(0, 0, prompt)
-    stdscr.addstr(1, 0, initial)
-    stdscr.move(1, len(initial))
-    stdscr.refresh()
-    value = stdscr.getstr(1, len(initial)).decode("utf-8", errors="ignore").strip()
-    curses.noecho()
-    return value
-
-
-def show_output_screen(stdscr, title: str, command: str, output: str, error: str):
-    # strip iwctl ANSI color codes so they don't leak as ^[[0m, etc.
-    output = strip_ansi(output or "")
-    error = strip_ansi(error or "")
-
-    stdscr.clear()
+    while True:
+        w = stdscr.getmaxyx()[1]
+        stdscr.move(1, 0)
+        stdscr.clrtoeol()
+        stdscr.addnstr(1, 0, "".join(buf), w - 1)
+        stdscr.noutrefresh()
+
+        key = await _getkey(stdscr)
+        if key in ("\n", "\r") or key == curses.KEY_ENTER:
+            return "".join(buf).strip()
+        elif key in ("\x7f", "\b") or key == curses.KEY_BACKSPACE:
+            if buf:
+                buf.pop()
+        elif key == curses.KEY_RESIZE:
+            curses.update_lines_cols()
+            stdscr.erase()
+            stdscr.addstr(0, 0, prompt)  # input line is redrawn by the loop
+        elif isinstance(key, str) and key.isprintable():
+            buf.append(key)
+        # other function keys are ignored, as getstr did
+
+
+def _split_clip(data: Union[str, bytes], limit: int) -> tuple[list, int]:
+    """
+    First `limit` lines of str-or-bytes `data`, plus how many lines were
+    cut.  Only the visible lines are sliced out; the cut-off tail is
+    never copied, just counted in place.
+    """
+    sep = b"\n" if isinstance(data, bytes) else "\n"
+    lines = []
+    pos = 0
+    n = len(data)
+    while pos < n and len(lines) < limit:
+        idx = data.find(sep, pos)
+        if idx < 0:
+            lines.append(data[pos:])
+            return lines, 0
+        lines.append(data[pos:idx])
+        pos = idx + 1
+    if pos >= n:  # consumed fully (a trailing newline adds no blank line)
+        return lines, 0
+    return lines, data.count(sep, pos) + (0 if data.endswith(sep) else 1)
+
+
+def _render_line(line: Union[str, bytes]) -> str:
+    """Decode (if bytes) and ANSI-strip one line for display."""
+    if isinstance(line, bytes):
+        line = line.decode("utf-8", errors="ignore")
+        return strip_ansi(line)
+    return strip_ansi(line)
+
+
+async def show_output_screen(
+    stdscr,
+    title: str,
+    command: str,
+    output: Union[bytes, str],
+    error: Union[bytes, str],
+) -> None:
+    stdscr.erase()  # see input_curses: keep curses' damage diffing active
     h, w = stdscr.getmaxyx()
 
-    stdscr.addstr(0, 0, title[: w - 1], curses.A_BOLD)
+    stdscr.addnstr(0, 0, title, w - 1, _ATTR_BOLD)
     cmd_line = f"$ {command}"
     if len(cmd_line) >= w:
         cmd_line = cmd_line[: w - 4] + "..."
-    stdscr.addstr(1, 0, cmd_line, curses.A_DIM)
+    stdscr.addstr(1, 0, cmd_line, _ATTR_CMD)
 
-    lines = []
+    # clip before decoding: only the visible slice of (possibly huge)
+    # iwctl output is ever decoded or ANSI-stripped
+    max_lines = max(h - 4, 0)
+    rows = []
+    remaining = 0
     if output:
-        lines.extend(output.splitlines())
+        lines, cut = _split_clip(output, max_lines)
+        rows += lines
+        remaining += cut
     if error:
-        if lines:
-            lines.append("")
-        lines.append("stderr:")
-        lines.extend(error.splitlines())
-
-    max_lines = h - 4
-    for i, line in enumerate(lines[:max_lines]):
-        stdscr.addstr(3 + i, 0, line[: w - 1])
-
-    if len(lines) > max_lines:
+        if output:
+            rows.append("")
+        rows.append("stderr:")
+        lines, cut = _split_clip(error, max_lines)
+        rows += lines
+        remaining += cut
+    if len(rows) > max_lines:
+        remaining += len(rows) - max_lines
+        del rows[max_lines:]
+
+    if rows:
+        # one addstr with embedded newlines: curses advances a row per
+        # "\n", so the whole body lands in a single C call instead of
+        # one Python call (and bounds check) per line
+        body = "\n".join(_render_line(line)[: w - 1] for line in rows)
+        stdscr.addstr(3, 0, body)
+
+    if remaining:
         stdscr.addstr(
             h - 2,
             0,
-            f"... output truncated ({len(lines) - max_lines} more lines) ...",
+            f"... output truncated ({remaining} more lines) ...",
         )
 
-    stdscr.addstr(h - 1, 0, "Press any key to go back...", curses.A_REVERSE)
-    stdscr.refresh()
-    stdscr.getch()
+    stdscr.addstr(h - 1, 0, "Press any key to go back...", _ATTR_STATUS)
+    stdscr.noutrefresh()
+    if await _getch(stdscr) == curses.KEY_RESIZE:
+        # re-clip and repaint at the new size instead of exiting
+        curses.update_lines_cols()
+        await show_output_screen(stdscr, title, command, output, error)
+
+
+def _menu_labels(items: Sequence[str]) -> tuple[str, ...]:
+    """Pre-render the "N) item" labels once so menus don't re-format them."""
+    return tuple(f"{idx + 1}) {item}" for idx, item in enumerate(items))
+
+
+def _menu_paint(stdscr, title: str, labels: Sequence[str], current: int) -> None:
+    """
+    Full repaint of a menu screen.  erase() (not clear()) so curses can
+    diff against what is already on screen instead of blanking it.
+    """
+    stdscr.erase()
+    h, w = stdscr.getmaxyx()
+    draw_centered(stdscr, 0, title, _ATTR_TITLE)
+
+    for idx, label in enumerate(labels):
+        if idx == current:
+            # use STANDOUT so it follows the user's theme
+            stdscr.addstr(2 + idx, 2, label[: w - 3], _ATTR_HL)
+        else:
+            stdscr.addstr(2 + idx, 2, label[: w - 3])
+
+    stdscr.addstr(h - 1, 0, "↑/↓ to navigate, Enter to select", _ATTR_CMD)
+
+
+def _menu_move_highlight(stdscr, labels: Sequence[str], prev: int, current: int) -> None:
+    """Move the selection bar by retouching only the two affected rows."""
+    w = stdscr.getmaxyx()[1]
+    stdscr.chgat(2 + prev, 2, min(len(labels[prev]), w - 3), curses.A_NORMAL)
+    stdscr.chgat(2 + current, 2, min(len(labels[current]), w - 3), _ATTR_HL)
+
+
+# Rendered "N) item" labels per menu, keyed by the identity of its items
+# tuple.  All menus are module-level constants, so the keys never dangle
+# and every entry is computed exactly once per process.
+_label_cache: dict[int, tuple[str, ...]] = {}
 
 
-def generic_menu(stdscr, title: str, items: list[str], start_index: int = 0) -> int:
+async def generic_menu(
+    stdscr, title: str, items: Sequence[str], start_index: int = 0
+) -> int:
+    labels = _label_cache.get(id(items))
+    if labels is None:
+        labels = _label_cache[id(items)] = _menu_labels(items)
     current = start_index
+    _menu_paint(stdscr, title, labels, current)
+    stdscr.noutrefresh()
     while True:
-        stdscr.clear()
-        h, w = stdscr.getmaxyx()
-        draw_centered(stdscr, 0, title, curses.A_BOLD | curses.A_UNDERLINE)
-
-        for idx, item in enumerate(items):
-            y = 2 + idx
-            label = f"{idx + 1}) {item}"
-            if idx == current:
-                # use STANDOUT so it follows the user's theme
-                stdscr.addstr(y, 2, label[: w - 3], curses.A_STANDOUT)
-            else:
-                stdscr.addstr(y, 2, label[: w - 3])
-
-        stdscr.addstr(h - 1, 0, "↑/↓ to navigate, Enter to select", curses.A_DIM)
-        stdscr.refresh()
-
-        key = stdscr.getch()
-        if key in (curses.KEY_UP, ord("k")):
-            current = (current - 1) % len(items)
-        elif key in (curses.KEY_DOWN, ord("j")):
-            current = (current + 1) % len(items)
-        elif key in (curses.KEY_ENTER, 10, 13):
-            return current
-        elif key in (ord("q"), 27):  # q or ESC = last option (Back/Quit)
-            return len(items) - 1
+        key = await _getch(stdscr)
+        prev = current
+        repaint = False
+        # Process every key already buffered (arrow auto-repeat queues
+        # several per frame) before rendering, so a held key causes one
+        # highlight move per batch instead of one repaint per event.
+        while True:
+            if key in (curses.KEY_UP, ord("k")):
+                current = (current - 1) % len(items)
+            elif key in (curses.KEY_DOWN, ord("j")):
+                current = (current + 1) % len(items)
+            elif key in (curses.KEY_ENTER, 10, 13):
+                return current
+            elif key == 18:  # Ctrl-R: drop cached iwctl output
+                _invalidate_cache()
+            elif key in (ord("q"), 27):  # q or ESC = last option (Back/Quit)
+                return len(items) - 1
+            elif key == curses.KEY_RESIZE:
+                # refresh curses.LINES/COLS before repainting at the new size
+                curses.update_lines_cols()
+                repaint = True
+            if _key_queue.empty():
+                break
+            key = await _getch(stdscr)
+        if repaint:
+            _menu_paint(stdscr, title, labels, current)
+            stdscr.noutrefresh()
+        elif current != prev:
+            _menu_move_highlight(stdscr, labels, prev, current)
+            stdscr.noutrefresh()
+
+
+async def flash(stdscr, msg: str) -> None:
+    """
+    Show a one-line reverse-video notice over the bottom row and pause
+    briefly.  For validation slips ("No key.", bad BSSID) this replaces
+    the full framed output screen plus its press-any-key round trip.
+    """
+    h, w = stdscr.getmaxyx()
+    stdscr.addnstr(h - 1, 0, msg, w - 1, _ATTR_STATUS)
+    stdscr.clrtoeol()
+    stdscr.noutrefresh()
+    curses.doupdate()
+    await asyncio.sleep(0.7)
 
 
 # ---------- small helpers for wlan/adapter ----------
 
-def ask_wlan(stdscr, state: AppState, action: str) -> Optional[str]:
+# How long a typed wlan override stays the suggested default; interfaces
+# are stable in practice, but don't shadow the configured station forever.
+_WLAN_OVERRIDE_TTL = 30.0
+
+
+async def ask_wlan(stdscr, state: AppState, action: str) -> Optional[str]:
     default = state.station or ""
+    # within the TTL, a wlan the user typed for the previous action is
+    # offered as the default, so a run of actions against a non-default
+    # interface is Enter-Enter-Enter instead of retyping it every time
+    if (
+        state.wlan_override
+        and time.monotonic() - state.wlan_override_ts < _WLAN_OVERRIDE_TTL
+    ):
+        default = state.wlan_override
     prompt = (
-        f"wlan for {action} (current default: {state.station!r}) "
+        f"wlan for {action} (current default: {default!r}) "
         "[Enter = use default]: "
     )
-    sel = input_curses(stdscr, prompt, "")
+    sel = await input_curses(stdscr, prompt, "")
     if not sel:
         sel = default
     if not sel:
-        show_output_screen(
-            stdscr,
-            "Error",
-            "N/A",
-            "",
-            "No wlan specified and no default station configured.",
-        )
+        await flash(stdscr, "No wlan specified and no default station configured.")
         return None
+    if sel != (state.station or ""):
+        state.wlan_override = sel
+        state.wlan_override_ts = time.monotonic()
+    else:
+        state.wlan_override = None
     return sel
 
 
-def ask_adapter(stdscr, state: AppState, action: str) -> Optional[str]:
+async def ask_adapter(stdscr, state: AppState, action: str) -> Optional[str]:
     default = state.adapter or ""
     prompt = (
         f"Adapter/phy for {action} (current default: {state.adapter!r}) "
         "[Enter = use default]: "
     )
-    sel = input_curses(stdscr, prompt, "")
+    sel = await input_curses(stdscr, prompt, "")
     if not sel:
         sel = default
     if not sel:
-        show_output_screen(
-            stdscr,
-            "Error",
-            "N/A",
-            "",
-            "No adapter specified and no default adapter configured.",
-        )
+        await flash(stdscr, "No adapter specified and no default adapter configured.")
         return None
     return sel
 
 
-# ---------- Submenus (unchanged logic) ----------
-
-# Adapters:
-def submenu_adapters(stdscr, state: AppState):
-    items = [
-        "List adapters",
-        "Show adapter info",
-        "Set adapter property",
-        "Back",
-    ]
+# ---------- Submenus (declarative) ----------
+#
+# Every submenu action follows the same shape: maybe ask for a wlan or
+# adapter, maybe prompt for a few values, run iwctl, show the output.
+# Instead of one if/elif ladder per submenu, each entry is described by
+# an Action record and executed by run_action; a submenu is just a table.
+
+# Validation for values that would otherwise cost a full iwctl round
+# trip just to be rejected by iwd.
+_BSSID_RE = re.compile(r"[0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5}")
+_ONOFF = frozenset(("on", "off"))
+
+
+@dataclass(frozen=True)
+class Prompt:
+    """One input_curses prompt feeding a placeholder in Action.argv."""
+    key: str                # placeholder name in the argv template
+    text: str               # prompt text; may reference earlier values
+    missing: str = ""       # error shown when a required value is empty
+    optional: bool = False  # empty value drops the placeholder from argv
+    choices: Optional[frozenset] = None  # lowercased answer must be in here
+    pattern: Optional["re.Pattern"] = None  # answer must fullmatch this
+    invalid: str = ""       # error shown when the pattern does not match
+
+
+@dataclass(frozen=True)
+class Action:
+    """One submenu entry: menu label, output title and an argv template."""
+    label: str
+    title: str
+    argv: tuple[str, ...]
+    needs_wlan: bool = False
+    needs_adapter: bool = False
+    prompts: tuple[Prompt, ...] = ()
+    # display command for actions whose argv has no placeholders,
+    # rendered once at table-build time instead of per invocation
+    display: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        # interned: these strings are passed around and compared for the
+        # whole process lifetime, one copy each is enough
+        object.__setattr__(self, "label", sys.intern(self.label))
+        object.__setattr__(self, "title", sys.intern(self.title))
+        if not any(part.startswith("{") for part in self.argv):
+            object.__setattr__(self, "display", sys.intern(_fmt_cmd(self.argv)))
+
+
+_SPINNER = "|/-\\"
+
+
+async def _run(
+    stdscr, title: str, argv: Sequence[str], display: Optional[str] = None
+) -> None:
+    """Run one iwctl invocation and show its result screen.
+
+    The command runs as a task so the event loop keeps spinning; if it
+    takes noticeably long (scan, connect, enroll), a spinner replaces
+    the menu footer and ESC cancels the command (the subprocess is
+    killed, the session torn down - run_iwctl handles both).
+    """
+    if display is None:
+        display = _fmt_cmd(argv)
+    task = asyncio.ensure_future(run_iwctl(argv))
+    frame = 0
+    status = f"Running: {display}  [ESC cancels] "
     while True:
-        choice = generic_menu(stdscr, "IWCTL ADAPTERS SUBMENU", items)
-
-        if choice == 0:  # adapter list
-            args = ["adapter", "list"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr,
-                "Adapters - List",
-                "iwctl " + " ".join(args),
-                out,
-                err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 1:  # adapter <phy> show
-            phy = ask_adapter(stdscr, state, "show")
-            if not phy:
-                continue
-            args = ["adapter", phy, "show"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr,
-                "Adapters - Show",
-                "iwctl " + " ".join(args),
-                out,
-                err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 2:  # adapter <phy> set-property <name> <value>
-            phy = ask_adapter(stdscr, state, "set-property")
-            if not phy:
-                continue
-            prop_name = input_curses(stdscr, "Property name (e.g. Powered): ")
-            if not prop_name:
-                show_output_screen(stdscr, "Error", "N/A", "", "No property name.")
-                continue
-            prop_val = input_curses(
-                stdscr, f"Property value for {prop_name} (e.g. on/off): "
-            )
-            if not prop_val:
-                show_output_screen(stdscr, "Error", "N/A", "", "No property value.")
-                continue
-            args = ["adapter", phy, "set-property", prop_name, prop_val]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr,
-                "Adapters - Set property",
-                "iwctl " + " ".join(args),
-                out,
-                err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 3:
+        done, _ = await asyncio.wait((task,), timeout=0.2)
+        if done:
+            break
+        while not _key_queue.empty():
+            key = _key_queue.get_nowait()
+            if key == "\x1b" or key == 27:  # ESC
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                return
+        h, w = stdscr.getmaxyx()
+        stdscr.addnstr(h - 1, 0, status + _SPINNER[frame & 3], w - 1, _ATTR_STATUS)
+        stdscr.clrtoeol()
+        stdscr.noutrefresh()
+        curses.doupdate()
+        frame += 1
+    out, err, rc = task.result()
+    await show_output_screen(stdscr, title, display, out, _fmt_err(err, rc))
+
+
+async def prompt_form(
+    stdscr, title: str, prompts: Sequence["Prompt"], values: dict
+) -> bool:
+    """
+    Collect all of an action's prompts on one screen.
+
+    Answered fields stay visible above the next one and Enter advances,
+    so a multi-input action (connect, set-property, enroll) is one
+    stable screen instead of a fresh full-screen prompt per field.
+    Validates each answer like run_action did; shows the error screen
+    and returns False on a missing or invalid value.
+    """
+    stdscr.erase()
+    h, w = stdscr.getmaxyx()
+    stdscr.addnstr(0, 0, title, w - 1, _ATTR_BOLD)
+    for i, prompt in enumerate(prompts):
+        # prompt text may reference earlier values,
+        # e.g. "Property value for {prop_name} ..."
+        text = prompt.text.format(**values) if "{" in prompt.text else prompt.text
+        label_row = 2 + i * 2
+        row = label_row + 1
+        stdscr.addnstr(label_row, 0, text, w - 1)
+        buf = []
+        while True:
+            stdscr.move(row, 2)
+            stdscr.clrtoeol()
+            stdscr.addnstr(row, 2, "".join(buf), w - 3)
+            stdscr.noutrefresh()
+            key = await _getkey(stdscr)
+            if key in ("\n", "\r") or key == curses.KEY_ENTER:
+                break
+            elif key in ("\x7f", "\b") or key == curses.KEY_BACKSPACE:
+                if buf:
+                    buf.pop()
+            elif key == curses.KEY_RESIZE:
+                curses.update_lines_cols()
+                stdscr.erase()
+                h, w = stdscr.getmaxyx()
+                stdscr.addnstr(0, 0, title, w - 1, _ATTR_BOLD)
+                for j, done in enumerate(prompts[:i]):
+                    t = done.text.format(**values) if "{" in done.text else done.text
+                    stdscr.addnstr(2 + j * 2, 0, t, w - 1)
+                    stdscr.addnstr(3 + j * 2, 2, values.get(done.key, ""), w - 3)
+                stdscr.addnstr(label_row, 0, text, w - 1)
+            elif isinstance(key, str) and key.isprintable():
+                buf.append(key)
+        val = "".join(buf).strip()
+        if prompt.choices is not None:
+            val = val.lower()
+            if val not in prompt.choices:
+                await flash(stdscr, prompt.missing)
+                return False
+        elif not val:
+            if not prompt.optional:
+                await flash(stdscr, prompt.missing)
+                return False
+        elif prompt.pattern is not None and not prompt.pattern.fullmatch(val):
+            # reject in-process: no point spawning iwctl for input iwd
+            # is guaranteed to refuse
+            await flash(stdscr, prompt.invalid)
+            return False
+        values[prompt.key] = val
+    return True
+
+
+async def run_action(stdscr, state: AppState, action: Action) -> None:
+    """Collect the action's inputs, run iwctl and display the result."""
+    values = {}
+
+    if action.needs_wlan:
+        wlan = await ask_wlan(stdscr, state, action.label)
+        if not wlan:
+            return
+        values["wlan"] = wlan
+    if action.needs_adapter:
+        phy = await ask_adapter(stdscr, state, action.label)
+        if not phy:
+            return
+        values["phy"] = phy
+
+    if action.prompts:
+        if not await prompt_form(stdscr, action.title, action.prompts, values):
             return
 
+    args = []
+    for part in action.argv:
+        if part.startswith("{") and part.endswith("}"):
+            val = values[part[1:-1]]
+            if not val:  # optional prompt left empty
+                continue
+            args.append(val)
+        else:
+            args.append(part)
 
-# Ad-Hoc:
-def submenu_ad_hoc(stdscr, state: AppState):
-    items = [
-        "List Ad-Hoc devices",
-        "Start Ad-Hoc network",
-        "Start open Ad-Hoc network",
-        "Stop Ad-Hoc on wlan",
-        "Back",
-    ]
+    await _run(stdscr, action.title, args, action.display or None)
+
+
+def _action_menu_items(actions: Sequence) -> tuple[str, ...]:
+    """Menu item texts for an action table, with the trailing Back entry."""
+    labels = [a.label if isinstance(a, Action) else a[0] for a in actions]
+    labels.append("Back")
+    return tuple(labels)
+
+
+async def action_menu(
+    stdscr, state: AppState, title: str, actions: Sequence, items: Sequence[str]
+) -> None:
+    """Run one submenu: pick an entry, execute it, repeat until Back."""
+    choice = 0
     while True:
-        choice = generic_menu(stdscr, "IWCTL AD-HOC SUBMENU", items)
-
-        if choice == 0:  # ad-hoc list
-            args = ["ad-hoc", "list"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr,
-                "Ad-Hoc - List",
-                "iwctl " + " ".join(args),
-                out,
-                err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 1:  # ad-hoc <wlan> start "name" pass
-            wlan = ask_wlan(stdscr, state, "Ad-Hoc start")
-            if not wlan:
-                continue
-            name = input_curses(
-                stdscr,
-                'Network name (SSID, can contain spaces; no quotes needed): ',
-            )
-            if not name:
-                show_output_screen(stdscr, "Error", "N/A", "", "No network name.")
-                continue
-            pw = input_curses(stdscr, "Passphrase: ")
-            if not pw:
-                show_output_screen(stdscr, "Error", "N/A", "", "No passphrase.")
-                continue
-            args = ["ad-hoc", wlan, "start", name, pw]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr,
-                "Ad-Hoc - Start",
-                "iwctl " + " ".join(args),
-                out,
-                err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 2:  # ad-hoc <wlan> start_open "name"
-            wlan = ask_wlan(stdscr, state, "Ad-Hoc start_open")
-            if not wlan:
-                continue
-            name = input_curses(
-                stdscr,
-                'Open Ad-Hoc network name (SSID): ',
-            )
-            if not name:
-                show_output_screen(stdscr, "Error", "N/A", "", "No network name.")
-                continue
-            args = ["ad-hoc", wlan, "start_open", name]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr,
-                "Ad-Hoc - Start open",
-                "iwctl " + " ".join(args),
-                out,
-                err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 3:  # ad-hoc <wlan> stop
-            wlan = ask_wlan(stdscr, state, "Ad-Hoc stop")
-            if not wlan:
-                continue
-            args = ["ad-hoc", wlan, "stop"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr,
-                "Ad-Hoc - Stop",
-                "iwctl " + " ".join(args),
-                out,
-                err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 4:
+        # re-enter on the last-used row: the common "run it again" flow
+        # needs no cursor movement (and so no highlight repaints) at all
+        choice = await generic_menu(stdscr, title, items, start_index=choice)
+        if choice >= len(actions):  # Back
             return
+        entry = actions[choice]
+        if isinstance(entry, Action):
+            await run_action(stdscr, state, entry)
+        else:  # (label, coroutine) pair for entries that aren't iwctl calls
+            await entry[1](stdscr, state)
+
+
+# Adapters:
+_ADAPTER_ACTIONS = (
+    Action("List adapters", "Adapters - List", ("adapter", "list")),
+    Action(
+        "Show adapter info", "Adapters - Show",
+        ("adapter", "{phy}", "show"), needs_adapter=True,
+    ),
+    Action(
+        "Set adapter property", "Adapters - Set property",
+        ("adapter", "{phy}", "set-property", "{prop_name}", "{prop_val}"),
+        needs_adapter=True,
+        prompts=(
+            Prompt("prop_name", "Property name (e.g. Powered): ", "No property name."),
+            Prompt(
+                "prop_val",
+                "Property value for {prop_name} (e.g. on/off): ",
+                "No property value.",
+            ),
+        ),
+    ),
+)
+_ADAPTERS_ITEMS = _action_menu_items(_ADAPTER_ACTIONS)
+
+
+async def submenu_adapters(stdscr, state: AppState) -> None:
+    await action_menu(
+        stdscr, state, "IWCTL ADAPTERS SUBMENU",
+        _ADAPTER_ACTIONS, _ADAPTERS_ITEMS,
+    )
+
+
+# Ad-Hoc:
+_AD_HOC_ACTIONS = (
+    Action("List Ad-Hoc devices", "Ad-Hoc - List", ("ad-hoc", "list")),
+    Action(
+        "Start Ad-Hoc network", "Ad-Hoc - Start",
+        ("ad-hoc", "{wlan}", "start", "{name}", "{pw}"), needs_wlan=True,
+        prompts=(
+            Prompt(
+                "name",
+                "Network name (SSID, can contain spaces; no quotes needed): ",
+                "No network name.",
+            ),
+            Prompt("pw", "Passphrase: ", "No passphrase."),
+        ),
+    ),
+    Action(
+        "Start open Ad-Hoc network", "Ad-Hoc - Start open",
+        ("ad-hoc", "{wlan}", "start_open", "{name}"), needs_wlan=True,
+        prompts=(
+            Prompt("name", "Open Ad-Hoc network name (SSID): ", "No network name."),
+        ),
+    ),
+    Action(
+        "Stop Ad-Hoc on wlan", "Ad-Hoc - Stop",
+        ("ad-hoc", "{wlan}", "stop"), needs_wlan=True,
+    ),
+)
+_AD_HOC_ITEMS = _action_menu_items(_AD_HOC_ACTIONS)
+
+
+async def submenu_ad_hoc(stdscr, state: AppState) -> None:
+    await action_menu(
+        stdscr, state, "IWCTL AD-HOC SUBMENU",
+        _AD_HOC_ACTIONS, _AD_HOC_ITEMS,
+    )
 
 
 # Access Point:
-def submenu_access_point(stdscr, state: AppState):
-    items = [
-        "List AP-mode devices",
-        "Start access point",
-        "Start access point from profile",
-        "Stop access point",
-        "Show AP info",
-        "Scan (AP)",
-        "Get AP networks",
-        "Back",
-    ]
-    while True:
-        choice = generic_menu(stdscr, "IWCTL AP SUBMENU", items)
-
-        if choice == 0:  # ap list
-            args = ["ap", "list"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "AP - List", "iwctl " + " ".join(args), out,
-                err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 1:  # ap <wlan> start "name" pass
-            wlan = ask_wlan(stdscr, state, "AP start")
-            if not wlan:
-                continue
-            name = input_curses(stdscr, 'AP network name (SSID): ')
-            if not name:
-                show_output_screen(stdscr, "Error", "N/A", "", "No network name.")
-                continue
-            pw = input_curses(stdscr, "Passphrase: ")
-            if not pw:
-                show_output_screen(stdscr, "Error", "N/A", "", "No passphrase.")
-                continue
-            args = ["ap", wlan, "start", name, pw]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "AP - Start", "iwctl " + " ".join(args), out,
-                err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 2:  # ap <wlan> start-profile "name"
-            wlan = ask_wlan(stdscr, state, "AP start-profile")
-            if not wlan:
-                continue
-            name = input_curses(
-                stdscr,
-                'Profile name / "network name": ',
-            )
-            if not name:
-                show_output_screen(stdscr, "Error", "N/A", "", "No profile name.")
-                continue
-            args = ["ap", wlan, "start-profile", name]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "AP - Start profile", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 3:  # ap <wlan> stop
-            wlan = ask_wlan(stdscr, state, "AP stop")
-            if not wlan:
-                continue
-            args = ["ap", wlan, "stop"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "AP - Stop", "iwctl " + " ".join(args), out,
-                err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 4:  # ap <wlan> show
-            wlan = ask_wlan(stdscr, state, "AP show")
-            if not wlan:
-                continue
-            args = ["ap", wlan, "show"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "AP - Show", "iwctl " + " ".join(args), out,
-                err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 5:  # ap <wlan> scan
-            wlan = ask_wlan(stdscr, state, "AP scan")
-            if not wlan:
-                continue
-            args = ["ap", wlan, "scan"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "AP - Scan", "iwctl " + " ".join(args), out,
-                err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 6:  # ap <wlan> get-networks
-            wlan = ask_wlan(stdscr, state, "AP get-networks")
-            if not wlan:
-                continue
-            args = ["ap", wlan, "get-networks"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "AP - Get networks", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 7:
-            return
+_AP_ACTIONS = (
+    Action("List AP-mode devices", "AP - List", ("ap", "list")),
+    Action(
+        "Start access point", "AP - Start",
+        ("ap", "{wlan}", "start", "{name}", "{pw}"), needs_wlan=True,
+        prompts=(
+            Prompt("name", "AP network name (SSID): ", "No network name."),
+            Prompt("pw", "Passphrase: ", "No passphrase."),
+        ),
+    ),
+    Action(
+        "Start access point from profile", "AP - Start profile",
+        ("ap", "{wlan}", "start-profile", "{name}"), needs_wlan=True,
+        prompts=(
+            Prompt("name", 'Profile name / "network name": ', "No profile name."),
+        ),
+    ),
+    Action("Stop access point", "AP - Stop", ("ap", "{wlan}", "stop"), needs_wlan=True),
+    Action("Show AP info", "AP - Show", ("ap", "{wlan}", "show"), needs_wlan=True),
+    Action("Scan (AP)", "AP - Scan", ("ap", "{wlan}", "scan"), needs_wlan=True),
+    Action(
+        "Get AP networks", "AP - Get networks",
+        ("ap", "{wlan}", "get-networks"), needs_wlan=True,
+    ),
+)
+_AP_ITEMS = _action_menu_items(_AP_ACTIONS)
+
+
+async def submenu_access_point(stdscr, state: AppState) -> None:
+    await action_menu(
+        stdscr, state, "IWCTL AP SUBMENU",
+        _AP_ACTIONS, _AP_ITEMS,
+    )
 
 
 # Devices:
-def submenu_devices(stdscr, state: AppState):
-    items = [
-        "List devices",
-        "Show device info",
-        "Set device property",
-        "Back",
-    ]
-    while True:
-        choice = generic_menu(stdscr, "IWCTL DEVICES SUBMENU", items)
-
-        if choice == 0:  # device list
-            args = ["device", "list"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "Devices - List", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 1:  # device <wlan> show
-            wlan = ask_wlan(stdscr, state, "device show")
-            if not wlan:
-                continue
-            args = ["device", wlan, "show"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "Devices - Show", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 2:  # device <wlan> set-property
-            wlan = ask_wlan(stdscr, state, "device set-property")
-            if not wlan:
-                continue
-            prop_name = input_curses(stdscr, "Property name: ")
-            if not prop_name:
-                show_output_screen(stdscr, "Error", "N/A", "", "No property name.")
-                continue
-            prop_val = input_curses(stdscr, "Property value: ")
-            if not prop_val:
-                show_output_screen(stdscr, "Error", "N/A", "", "No property value.")
-                continue
-            args = ["device", wlan, "set-property", prop_name, prop_val]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "Devices - Set property", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 3:
-            return
+_DEVICE_ACTIONS = (
+    Action("List devices", "Devices - List", ("device", "list")),
+    Action(
+        "Show device info", "Devices - Show",
+        ("device", "{wlan}", "show"), needs_wlan=True,
+    ),
+    Action(
+        "Set device property", "Devices - Set property",
+        ("device", "{wlan}", "set-property", "{prop_name}", "{prop_val}"),
+        needs_wlan=True,
+        prompts=(
+            Prompt("prop_name", "Property name: ", "No property name."),
+            Prompt("prop_val", "Property value: ", "No property value."),
+        ),
+    ),
+)
+_DEVICES_ITEMS = _action_menu_items(_DEVICE_ACTIONS)
+
+
+async def submenu_devices(stdscr, state: AppState) -> None:
+    await action_menu(
+        stdscr, state, "IWCTL DEVICES SUBMENU",
+        _DEVICE_ACTIONS, _DEVICES_ITEMS,
+    )
 
 
 # Known Networks:
-def submenu_known_networks(stdscr, state: AppState):
-    items = [
-        "List known networks",
-        "Show known network",
-        "Forget known network",
-        "Set known network property",
-        "Back",
-    ]
-    while True:
-        choice = generic_menu(stdscr, "IWCTL KNOWN NETWORKS SUBMENU", items)
-
-        if choice == 0:  # known-networks list
-            args = ["known-networks", "list"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "Known Networks - List", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice in (1, 2, 3):
-            name = input_curses(
-                stdscr,
-                'Known network name (as shown in list, may need quotes normally): ',
-            )
-            if not name:
-                show_output_screen(stdscr, "Error", "N/A", "", "No network name.")
-                continue
-
-            if choice == 1:  # show
-                args = ["known-networks", name, "show"]
-                title = "Known Networks - Show"
-            elif choice == 2:  # forget
-                args = ["known-networks", name, "forget"]
-                title = "Known Networks - Forget"
-            else:  # set-property
-                prop_name = input_curses(stdscr, "Property name: ")
-                if not prop_name:
-                    show_output_screen(stdscr, "Error", "N/A", "", "No property name.")
-                    continue
-                prop_val = input_curses(stdscr, "Property value: ")
-                if not prop_val:
-                    show_output_screen(
-                        stdscr, "Error", "N/A", "", "No property value."
-                    )
-                    continue
-                args = ["known-networks", name, "set-property", prop_name, prop_val]
-                title = "Known Networks - Set property"
-
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, title, "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 4:
-            return
+_KNOWN_NET_PROMPT = Prompt(
+    "name",
+    "Known network name (as shown in list, may need quotes normally): ",
+    "No network name.",
+)
+_KNOWN_NETWORKS_ACTIONS = (
+    Action("List known networks", "Known Networks - List", ("known-networks", "list")),
+    Action(
+        "Show known network", "Known Networks - Show",
+        ("known-networks", "{name}", "show"), prompts=(_KNOWN_NET_PROMPT,),
+    ),
+    Action(
+        "Forget known network", "Known Networks - Forget",
+        ("known-networks", "{name}", "forget"), prompts=(_KNOWN_NET_PROMPT,),
+    ),
+    Action(
+        "Set known network property", "Known Networks - Set property",
+        ("known-networks", "{name}", "set-property", "{prop_name}", "{prop_val}"),
+        prompts=(
+            _KNOWN_NET_PROMPT,
+            Prompt("prop_name", "Property name: ", "No property name."),
+            Prompt("prop_val", "Property value: ", "No property value."),
+        ),
+    ),
+)
+_KNOWN_NETWORKS_ITEMS = _action_menu_items(_KNOWN_NETWORKS_ACTIONS)
+
+
+async def submenu_known_networks(stdscr, state: AppState) -> None:
+    await action_menu(
+        stdscr, state, "IWCTL KNOWN NETWORKS SUBMENU",
+        _KNOWN_NETWORKS_ACTIONS, _KNOWN_NETWORKS_ITEMS,
+    )
 
 
 # WiFi Simple Configuration (WSC):
-def submenu_wsc(stdscr, state: AppState):
-    items = [
-        "List WSC-capable devices",
-        "PushButton mode",
-        "Start user PIN mode",
-        "Start PIN (generated)",
-        "Cancel WSC",
-        "Back",
-    ]
-    while True:
-        choice = generic_menu(stdscr, "IWCTL WSC SUBMENU", items)
-
-        if choice == 0:  # wsc list
-            args = ["wsc", "list"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "WSC - List", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice in (1, 2, 3, 4):
-            wlan = ask_wlan(stdscr, state, "WSC")
-            if not wlan:
-                continue
-
-            if choice == 1:  # push-button
-                args = ["wsc", wlan, "push-button"]
-                title = "WSC - PushButton"
-            elif choice == 2:  # start-user-pin <PIN>
-                pin = input_curses(stdscr, "PIN (e.g. 12345670): ")
-                if not pin:
-                    show_output_screen(stdscr, "Error", "N/A", "", "No PIN entered.")
-                    continue
-                args = ["wsc", wlan, "start-user-pin", pin]
-                title = "WSC - Start user PIN"
-            elif choice == 3:  # start-pin
-                args = ["wsc", wlan, "start-pin"]
-                title = "WSC - Start PIN (generated)"
-            else:  # cancel
-                args = ["wsc", wlan, "cancel"]
-                title = "WSC - Cancel"
-
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, title, "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 5:
-            return
+_WSC_ACTIONS = (
+    Action("List WSC-capable devices", "WSC - List", ("wsc", "list")),
+    Action(
+        "PushButton mode", "WSC - PushButton",
+        ("wsc", "{wlan}", "push-button"), needs_wlan=True,
+    ),
+    Action(
+        "Start user PIN mode", "WSC - Start user PIN",
+        ("wsc", "{wlan}", "start-user-pin", "{pin}"), needs_wlan=True,
+        prompts=(Prompt("pin", "PIN (e.g. 12345670): ", "No PIN entered."),),
+    ),
+    Action(
+        "Start PIN (generated)", "WSC - Start PIN (generated)",
+        ("wsc", "{wlan}", "start-pin"), needs_wlan=True,
+    ),
+    Action("Cancel WSC", "WSC - Cancel", ("wsc", "{wlan}", "cancel"), needs_wlan=True),
+)
+_WSC_ITEMS = _action_menu_items(_WSC_ACTIONS)
+
+
+async def submenu_wsc(stdscr, state: AppState) -> None:
+    await action_menu(
+        stdscr, state, "IWCTL WSC SUBMENU",
+        _WSC_ACTIONS, _WSC_ITEMS,
+    )
 
 
 # Station:
-def submenu_station(stdscr, state: AppState):
-    items = [
-        "List station devices",
-        "Connect to network",
-        "Connect to hidden network",
-        "Disconnect",
-        "Get networks",
-        "Get hidden access points",
-        "Scan for networks",
-        "Show station info",
-        "Get BSSes",
-        "Change default station / adapter",
-        "Back",
-    ]
-    while True:
-        choice = generic_menu(stdscr, "IWCTL STATION SUBMENU", items)
-
-        if choice == 0:  # station list
-            args = ["station", "list"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "Station - List", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 1:  # connect
-            wlan = ask_wlan(stdscr, state, "station connect")
-            if not wlan:
-                continue
-            name = input_curses(
-                stdscr,
-                "Network name (SSID): ",
-            )
-            if not name:
-                show_output_screen(stdscr, "Error", "N/A", "", "No network name.")
-                continue
-            security = input_curses(
-                stdscr,
+async def _change_defaults(stdscr, state: AppState) -> None:
+    new_station = await input_curses(
+        stdscr,
+        f"New default station (current {state.station!r}, empty = keep): ",
+    )
+    new_adapter = await input_curses(
+        stdscr,
+        f"New default adapter (current {state.adapter!r}, empty = keep): ",
+    )
+    if new_station:
+        state.station = new_station
+        state.wlan_override = None  # new default wins over any override
+    if new_adapter:
+        state.adapter = new_adapter
+    state.save()
+    text = (
+        "Defaults updated:\n\n"
+        f"  Station: {state.station!r}\n"
+        f"  Adapter: {state.adapter!r}\n"
+    )
+    await show_output_screen(stdscr, "Station - Defaults updated", "N/A", text, "")
+
+
+_STATION_ACTIONS = (
+    Action("List station devices", "Station - List", ("station", "list")),
+    Action(
+        "Connect to network", "Station - Connect",
+        ("station", "{wlan}", "connect", "{name}", "{security}"), needs_wlan=True,
+        prompts=(
+            Prompt("name", "Network name (SSID): ", "No network name."),
+            Prompt(
+                "security",
                 "Security (optional, e.g. psk, leave empty for default): ",
-            )
-            args = ["station", wlan, "connect", name]
-            if security:
-                args.append(security)
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "Station - Connect", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 2:  # connect-hidden
-            wlan = ask_wlan(stdscr, state, "station connect-hidden")
-            if not wlan:
-                continue
-            name = input_curses(stdscr, "Hidden network name (SSID): ")
-            if not name:
-                show_output_screen(stdscr, "Error", "N/A", "", "No network name.")
-                continue
-            args = ["station", wlan, "connect-hidden", name]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "Station - Connect hidden", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 3:  # disconnect
-            wlan = ask_wlan(stdscr, state, "station disconnect")
-            if not wlan:
-                continue
-            args = ["station", wlan, "disconnect"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "Station - Disconnect", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 4:  # get-networks [rssi-dbms/rssi-bars]
-            wlan = ask_wlan(stdscr, state, "station get-networks")
-            if not wlan:
-                continue
-            mode = input_curses(
-                stdscr,
+                optional=True,
+            ),
+        ),
+    ),
+    Action(
+        "Connect to hidden network", "Station - Connect hidden",
+        ("station", "{wlan}", "connect-hidden", "{name}"), needs_wlan=True,
+        prompts=(Prompt("name", "Hidden network name (SSID): ", "No network name."),),
+    ),
+    Action(
+        "Disconnect", "Station - Disconnect",
+        ("station", "{wlan}", "disconnect"), needs_wlan=True,
+    ),
+    Action(
+        "Get networks", "Station - Get networks",
+        ("station", "{wlan}", "get-networks", "{mode}"), needs_wlan=True,
+        prompts=(
+            Prompt(
+                "mode",
                 "Mode (optional: rssi-dbms / rssi-bars, empty for default): ",
-            )
-            args = ["station", wlan, "get-networks"]
-            if mode:
-                args.append(mode)
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "Station - Get networks", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 5:  # get-hidden-access-points [rssi-dbms]
-            wlan = ask_wlan(stdscr, state, "station get-hidden-access-points")
-            if not wlan:
-                continue
-            mode = input_curses(
-                stdscr,
+                optional=True,
+            ),
+        ),
+    ),
+    Action(
+        "Get hidden access points", "Station - Get hidden APs",
+        ("station", "{wlan}", "get-hidden-access-points", "{mode}"), needs_wlan=True,
+        prompts=(
+            Prompt(
+                "mode",
                 "Mode (optional: rssi-dbms, empty for default): ",
-            )
-            args = ["station", wlan, "get-hidden-access-points"]
-            if mode:
-                args.append(mode)
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "Station - Get hidden APs", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 6:  # scan
-            wlan = ask_wlan(stdscr, state, "station scan")
-            if not wlan:
-                continue
-            args = ["station", wlan, "scan"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "Station - Scan", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 7:  # show
-            wlan = ask_wlan(stdscr, state, "station show")
-            if not wlan:
-                continue
-            args = ["station", wlan, "show"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "Station - Show", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 8:  # get-bsses [network] [security]
-            wlan = ask_wlan(stdscr, state, "station get-bsses")
-            if not wlan:
-                continue
-            network = input_curses(
-                stdscr,
-                "Network (optional SSID, empty = all): ",
-            )
-            security = input_curses(
-                stdscr,
+                optional=True,
+            ),
+        ),
+    ),
+    Action(
+        "Scan for networks", "Station - Scan",
+        ("station", "{wlan}", "scan"), needs_wlan=True,
+    ),
+    Action(
+        "Show station info", "Station - Show",
+        ("station", "{wlan}", "show"), needs_wlan=True,
+    ),
+    Action(
+        "Get BSSes", "Station - Get BSSes",
+        ("station", "{wlan}", "get-bsses", "{network}", "{security}"), needs_wlan=True,
+        prompts=(
+            Prompt("network", "Network (optional SSID, empty = all): ", optional=True),
+            Prompt(
+                "security",
                 "Security (optional, e.g. psk, empty = any): ",
-            )
-            args = ["station", wlan, "get-bsses"]
-            if network:
-                args.append(network)
-            if security:
-                args.append(security)
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "Station - Get BSSes", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 9:  # change defaults
-            new_station = input_curses(
-                stdscr,
-                f"New default station (current {state.station!r}, empty = keep): ",
-            )
-            new_adapter = input_curses(
-                stdscr,
-                f"New default adapter (current {state.adapter!r}, empty = keep): ",
-            )
-            if new_station:
-                state.station = new_station
-            if new_adapter:
-                state.adapter = new_adapter
-            state.save()
-            text = (
-                "Defaults updated:\n\n"
-                f"  Station: {state.station!r}\n"
-                f"  Adapter: {state.adapter!r}\n"
-            )
-            show_output_screen(stdscr, "Station - Defaults updated", "N/A", text, "")
-
-        elif choice == 10:
-            return
+                optional=True,
+            ),
+        ),
+    ),
+    ("Change default station / adapter", _change_defaults),
+)
+_STATION_ITEMS = _action_menu_items(_STATION_ACTIONS)
+
+
+async def submenu_station(stdscr, state: AppState) -> None:
+    await action_menu(
+        stdscr, state, "IWCTL STATION SUBMENU",
+        _STATION_ACTIONS, _STATION_ITEMS,
+    )
 
 
 # Device Provisioning (DPP):
-def submenu_dpp(stdscr, state: AppState):
-    items = [
-        "List DPP-capable devices",
-        "Start DPP Enrollee",
-        "Start DPP Configurator",
-        "Stop DPP",
-        "Show DPP state",
-        "Back",
-    ]
-    while True:
-        choice = generic_menu(stdscr, "IWCTL DPP SUBMENU", items)
-
-        if choice == 0:  # dpp list
-            args = ["dpp", "list"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "DPP - List", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice in (1, 2, 3, 4):
-            wlan = ask_wlan(stdscr, state, "DPP")
-            if not wlan:
-                continue
-
-            if choice == 1:
-                args = ["dpp", wlan, "start-enrollee"]
-                title = "DPP - Start Enrollee"
-            elif choice == 2:
-                args = ["dpp", wlan, "start-configurator"]
-                title = "DPP - Start Configurator"
-            elif choice == 3:
-                args = ["dpp", wlan, "stop"]
-                title = "DPP - Stop"
-            else:
-                args = ["dpp", wlan, "show"]
-                title = "DPP - Show"
-
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, title, "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 5:
-            return
+_DPP_ACTIONS = (
+    Action("List DPP-capable devices", "DPP - List", ("dpp", "list")),
+    Action(
+        "Start DPP Enrollee", "DPP - Start Enrollee",
+        ("dpp", "{wlan}", "start-enrollee"), needs_wlan=True,
+    ),
+    Action(
+        "Start DPP Configurator", "DPP - Start Configurator",
+        ("dpp", "{wlan}", "start-configurator"), needs_wlan=True,
+    ),
+    Action("Stop DPP", "DPP - Stop", ("dpp", "{wlan}", "stop"), needs_wlan=True),
+    Action("Show DPP state", "DPP - Show", ("dpp", "{wlan}", "show"), needs_wlan=True),
+)
+_DPP_ITEMS = _action_menu_items(_DPP_ACTIONS)
+
+
+async def submenu_dpp(stdscr, state: AppState) -> None:
+    await action_menu(
+        stdscr, state, "IWCTL DPP SUBMENU",
+        _DPP_ACTIONS, _DPP_ITEMS,
+    )
 
 
 # PKEX:
-def submenu_pkex(stdscr, state: AppState):
-    items = [
-        "List PKEX-capable devices",
-        "Stop PKEX",
-        "Show PKEX state",
-        "Start PKEX enrollee",
-        "Start PKEX configurator",
-        "Back",
-    ]
-    while True:
-        choice = generic_menu(stdscr, "IWCTL PKEX SUBMENU", items)
-
-        if choice == 0:  # pkex list
-            args = ["pkex", "list"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "PKEX - List", "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice in (1, 2, 3, 4):
-            wlan = ask_wlan(stdscr, state, "PKEX")
-            if not wlan:
-                continue
-
-            if choice == 1:  # stop
-                args = ["pkex", wlan, "stop"]
-                title = "PKEX - Stop"
-            elif choice == 2:  # show
-                args = ["pkex", wlan, "show"]
-                title = "PKEX - Show"
-            else:
-                key = input_curses(stdscr, "Shared code key: ")
-                if not key:
-                    show_output_screen(stdscr, "Error", "N/A", "", "No key.")
-                    continue
-                ident = input_curses(
-                    stdscr,
-                    "Identifier (optional, empty for none): ",
-                )
-                if choice == 3:  # enroll
-                    args = ["pkex", wlan, "enroll", key]
-                    title = "PKEX - Enroll"
-                else:  # configure
-                    args = ["pkex", wlan, "configure", key]
-                    title = "PKEX - Configure"
-                if ident:
-                    args.append(ident)
-
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, title, "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 5:
-            return
+_PKEX_ACTIONS = (
+    Action("List PKEX-capable devices", "PKEX - List", ("pkex", "list")),
+    Action("Stop PKEX", "PKEX - Stop", ("pkex", "{wlan}", "stop"), needs_wlan=True),
+    Action("Show PKEX state", "PKEX - Show", ("pkex", "{wlan}", "show"), needs_wlan=True),
+    Action(
+        "Start PKEX enrollee", "PKEX - Enroll",
+        ("pkex", "{wlan}", "enroll", "{key}", "{ident}"), needs_wlan=True,
+        prompts=(
+            Prompt("key", "Shared code key: ", "No key."),
+            Prompt("ident", "Identifier (optional, empty for none): ", optional=True),
+        ),
+    ),
+    Action(
+        "Start PKEX configurator", "PKEX - Configure",
+        ("pkex", "{wlan}", "configure", "{key}", "{ident}"), needs_wlan=True,
+        prompts=(
+            Prompt("key", "Shared code key: ", "No key."),
+            Prompt("ident", "Identifier (optional, empty for none): ", optional=True),
+        ),
+    ),
+)
+_PKEX_ITEMS = _action_menu_items(_PKEX_ACTIONS)
+
+
+async def submenu_pkex(stdscr, state: AppState) -> None:
+    await action_menu(
+        stdscr, state, "IWCTL PKEX SUBMENU",
+        _PKEX_ACTIONS, _PKEX_ITEMS,
+    )
 
 
 # Station Debug:
-def submenu_station_debug(stdscr, state: AppState):
-    items = [
-        "Connect to specific BSS (BSSID)",
-        "Roam to BSS (BSSID)",
-        "Get networks (debug)",
-        "Set AutoConnect on/off",
-        "Back",
-    ]
-    while True:
-        choice = generic_menu(stdscr, "IWCTL STATION DEBUG SUBMENU", items)
-
-        if choice in (0, 1, 2, 3):
-            wlan = ask_wlan(stdscr, state, "debug")
-            if not wlan:
-                continue
-
-            if choice == 0:  # debug <wlan> connect <bssid>
-                bssid = input_curses(stdscr, "BSSID (e.g. 00:11:22:33:44:55): ")
-                if not bssid:
-                    show_output_screen(stdscr, "Error", "N/A", "", "No BSSID.")
-                    continue
-                args = ["debug", wlan, "connect", bssid]
-                title = "Debug - Connect BSSID"
-
-            elif choice == 1:  # roam
-                bssid = input_curses(stdscr, "BSSID to roam to: ")
-                if not bssid:
-                    show_output_screen(stdscr, "Error", "N/A", "", "No BSSID.")
-                    continue
-                args = ["debug", wlan, "roam", bssid]
-                title = "Debug - Roam BSSID"
-
-            elif choice == 2:  # get-networks
-                args = ["debug", wlan, "get-networks"]
-                title = "Debug - Get networks"
-
-            else:  # autoconnect on/off
-                val = input_curses(
-                    stdscr,
-                    "AutoConnect (on/off): ",
-                ).strip().lower()
-                if val not in ("on", "off"):
-                    show_output_screen(
-                        stdscr, "Error", "N/A", "",
-                        "Invalid value. Please type 'on' or 'off'.",
-                    )
-                    continue
-                args = ["debug", wlan, "autoconnect", val]
-                title = "Debug - AutoConnect"
-
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, title, "iwctl " + " ".join(args),
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-
-        elif choice == 4:
-            return
+_STATION_DEBUG_ACTIONS = (
+    Action(
+        "Connect to specific BSS (BSSID)", "Debug - Connect BSSID",
+        ("debug", "{wlan}", "connect", "{bssid}"), needs_wlan=True,
+        prompts=(
+            Prompt(
+                "bssid", "BSSID (e.g. 00:11:22:33:44:55): ", "No BSSID.",
+                pattern=_BSSID_RE,
+                invalid="Invalid BSSID (expected aa:bb:cc:dd:ee:ff).",
+            ),
+        ),
+    ),
+    Action(
+        "Roam to BSS (BSSID)", "Debug - Roam BSSID",
+        ("debug", "{wlan}", "roam", "{bssid}"), needs_wlan=True,
+        prompts=(
+            Prompt(
+                "bssid", "BSSID to roam to: ", "No BSSID.",
+                pattern=_BSSID_RE,
+                invalid="Invalid BSSID (expected aa:bb:cc:dd:ee:ff).",
+            ),
+        ),
+    ),
+    Action(
+        "Get networks (debug)", "Debug - Get networks",
+        ("debug", "{wlan}", "get-networks"), needs_wlan=True,
+    ),
+    Action(
+        "Set AutoConnect on/off", "Debug - AutoConnect",
+        ("debug", "{wlan}", "autoconnect", "{val}"), needs_wlan=True,
+        prompts=(
+            Prompt(
+                "val",
+                "AutoConnect (on/off): ",
+                "Invalid value. Please type 'on' or 'off'.",
+                choices=_ONOFF,
+            ),
+        ),
+    ),
+)
+_STATION_DEBUG_ITEMS = _action_menu_items(_STATION_DEBUG_ACTIONS)
+
+
+async def submenu_station_debug(stdscr, state: AppState) -> None:
+    await action_menu(
+        stdscr, state, "IWCTL STATION DEBUG SUBMENU",
+        _STATION_DEBUG_ACTIONS, _STATION_DEBUG_ITEMS,
+    )
 
 
 # ---------- Main TUI ----------
 
-def main_menu(stdscr, state: AppState):
-    items = [
-        "Adapters",
-        "Ad-Hoc",
-        "Access Point",
-        "Devices",
-        "Known Networks",
-        "WiFi Simple Configuration",
-        "Station",
-        "Device Provisioning (DPP)",
-        "Shared Code Device Provisioning (PKEX)",
-        "Station Debug",
-        "version",
-        "quit",
-    ]
-
+_MAIN_ITEMS = (
+    "Adapters",
+    "Ad-Hoc",
+    "Access Point",
+    "Devices",
+    "Known Networks",
+    "WiFi Simple Configuration",
+    "Station",
+    "Device Provisioning (DPP)",
+    "Shared Code Device Provisioning (PKEX)",
+    "Station Debug",
+    "version",
+    "quit",
+)
+
+
+async def _main_version(stdscr, state: AppState) -> None:
+    await _run(stdscr, "iwctl version", ["version"])
+
+
+# One handler per _MAIN_ITEMS row; None marks the quit entry.
+_MAIN_HANDLERS = (
+    submenu_adapters,
+    submenu_ad_hoc,
+    submenu_access_point,
+    submenu_devices,
+    submenu_known_networks,
+    submenu_wsc,
+    submenu_station,
+    submenu_dpp,
+    submenu_pkex,
+    submenu_station_debug,
+    _main_version,
+    None,
+)
+
+
+async def main_menu(stdscr, state: AppState) -> None:
     while True:
-        choice = generic_menu(stdscr, "IWCTL HELPER", items)
-
-        if choice == 0:
-            submenu_adapters(stdscr, state)
-        elif choice == 1:
-            submenu_ad_hoc(stdscr, state)
-        elif choice == 2:
-            submenu_access_point(stdscr, state)
-        elif choice == 3:
-            submenu_devices(stdscr, state)
-        elif choice == 4:
-            submenu_known_networks(stdscr, state)
-        elif choice == 5:
-            submenu_wsc(stdscr, state)
-        elif choice == 6:
-            submenu_station(stdscr, state)
-        elif choice == 7:
-            submenu_dpp(stdscr, state)
-        elif choice == 8:
-            submenu_pkex(stdscr, state)
-        elif choice == 9:
-            submenu_station_debug(stdscr, state)
-        elif choice == 10:  # version
-            args = ["version"]
-            out, err, rc = run_iwctl(args)
-            show_output_screen(
-                stdscr, "iwctl version", "iwctl version",
-                out, err or ("" if rc == 0 else f"Exit code: {rc}"),
-            )
-        elif choice == 11:  # quit
-            break
+        choice = await generic_menu(stdscr, "IWCTL HELPER", _MAIN_ITEMS)
+        handler = _MAIN_HANDLERS[choice]
+        if handler is None:  # quit
+            return
+        await handler(stdscr, state)
+
+
+_colors_inited = False
 
 
-def curses_entry(stdscr, state: AppState):
+def curses_entry(stdscr, state: AppState) -> None:
     # Configure curses once, respecting user terminal theme
+    global _colors_inited
+    _init_attrs()
     curses.curs_set(0)
     stdscr.keypad(True)
-    if curses.has_colors():
+    # start_color renegotiates the terminal's color support; gate it so
+    # re-entering the UI within one process can never pay (or flicker
+    # through) that handshake twice
+    if curses.has_colors() and not _colors_inited:
         curses.start_color()
         curses.use_default_colors()  # key line: use terminal's default fg/bg
+        _colors_inited = True
 
-    main_menu(stdscr, state)
+    asyncio.run(tui_main(stdscr, state))
 
 
-def main():
+async def tui_main(stdscr, state: AppState) -> None:
+    """
+    Drive the curses UI from an asyncio event loop: stdin is registered
+    with the loop and keys are read non-blockingly, so long iwctl calls
+    never freeze keypress handling.
+    """
+    global _key_queue
+    _key_queue = asyncio.Queue()
+    stdscr.nodelay(True)
+    loop = asyncio.get_running_loop()
+    loop.add_reader(sys.stdin.fileno(), _pump_keys, stdscr, _key_queue)
+    loop.add_signal_handler(signal.SIGWINCH, _on_resize, stdscr, _key_queue)
+
+    if state.station:
+        # Fire-and-forget scan: iwd is already scanning by the time the
+        # user reaches Station -> Get networks, so the first listing is
+        # fresh without the usual multi-second wait.
+        state.scan_task = asyncio.create_task(
+            run_iwctl(["station", state.station, "scan"])
+        )
+
+    try:
+        await main_menu(stdscr, state)
+    finally:
+        if state.scan_task is not None and not state.scan_task.done():
+            state.scan_task.cancel()
+        loop.remove_signal_handler(signal.SIGWINCH)
+        loop.remove_reader(sys.stdin.fileno())
+        stdscr.nodelay(False)
+        await _session_close()
+
+
+def main() -> None:
+    # curses is imported here, not at module top: the first-run text setup
+    # (and anything that exits before the TUI) shouldn't pay for loading
+    # the C extension and parsing terminfo.
     state = AppState.load()
-    state = first_run_setup(state)
+    state = asyncio.run(first_run_setup(state))
+    # ncurses waits ESCDELAY ms after a bare ESC to see whether it starts
+    # an escape sequence; the 1000ms default makes ESC-to-go-back feel
+    # broken, 25ms is plenty for any modern terminal (must be set before
+    # initscr, hence before the import)
+    os.environ.setdefault("ESCDELAY", "25")
+    global curses
+    import curses
     curses.wrapper(curses_entry, state)
 
 